@@ -1,9 +1,18 @@
 """ActionMan: GitHub Actions utilities for Python."""
 
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from types import ModuleType as _ModuleType
+import importlib as _importlib
 import io as _io
 import sys as _sys
 
-from actionman import log, env_var, step_output, step_summary
+if _TYPE_CHECKING:
+    from actionman import exception, log, env_var, step_output, step_summary
+
+
+_SUBMODULES = frozenset(("exception", "log", "env_var", "step_output", "step_summary"))
+
+__all__ = ["in_gha", *sorted(_SUBMODULES)]
 
 
 def in_gha() -> bool:
@@ -15,13 +24,36 @@ def in_gha() -> bool:
     ----------
     - [GitHub Docs: Default environment variables](https://docs.github.com/en/actions/writing-workflows/choosing-what-your-workflow-does/store-information-in-variables#default-environment-variables)
     """
+    from actionman import env_var
+
     return bool(env_var.read("GITHUB_ACTIONS", bool))
 
 
-if hasattr(_sys.stdout, 'buffer'):
+def __getattr__(name: str) -> _ModuleType:
+    """Import submodules lazily on first attribute access.
+
+    This keeps `import actionman` cheap for programs that only use some of the submodules,
+    e.g., avoiding the import of `rich` when no logging is done.
+    """
+    if name in _SUBMODULES:
+        module = _importlib.import_module(f"actionman.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module 'actionman' has no attribute '{name}'")
+
+
+def __dir__() -> list[str]:
+    return sorted(globals().keys() | _SUBMODULES)
+
+
+if hasattr(_sys.stdout, 'buffer') and not (_sys.stdout.encoding or '').lower().startswith('utf'):
     # Wrap the standard output stream to change its encoding to UTF-8,
     # which is required for writing unicode characters (e.g., emojis) to the console in Windows.
     # However, this works in standard Python environments where sys.stdout is a regular file object;
     # in environments like Jupyter, sys.stdout is already set up to handle Unicode,
     # and does not need to be (and cannot be) wrapped in this way.
-    _sys.stdout = _io.TextIOWrapper(_sys.stdout.buffer, encoding='utf-8')
+    # Streams that already use UTF-8 (e.g., on Linux runners) are left as they are,
+    # to avoid stacking an extra buffering layer on top of them.
+    _sys.stdout = _io.TextIOWrapper(
+        _sys.stdout.buffer, encoding='utf-8', line_buffering=_sys.stdout.line_buffering
+    )
@@ -0,0 +1,150 @@
+"""Writing to the environment files of a GitHub Actions job step.
+
+Content is written to the end of an environment file immediately,
+in a single system call on a cached append-mode file descriptor.
+
+References
+----------
+- [GitHub Docs: Workflow Commands for GitHub Actions: Environment files](https://docs.github.com/en/actions/using-workflows/workflow-commands-for-github-actions#environment-files)
+"""
+
+from functools import lru_cache as _lru_cache
+import os as _os
+
+from actionman import _format
+from actionman.exception import ActionManGitHubError as _ActionManGitHubError
+
+
+_FILE_DESCRIPTORS: dict[str, int] = {}
+_OPEN_FLAGS = _os.O_WRONLY | _os.O_APPEND | _os.O_CREAT | getattr(_os, "O_BINARY", 0)
+
+
+@_lru_cache(maxsize=None)
+def get_filepath(env_var_name: str) -> str:
+    """Get the path to an environment file, resolving it on first use.
+
+    Parameters
+    ----------
+    env_var_name : str
+        Name of the environment variable holding the path, e.g., 'GITHUB_OUTPUT'.
+
+    Raises
+    ------
+    actionman.exception.ActionManGitHubError
+        If the environment variable is not set.
+    """
+    filepath = _os.environ.get(env_var_name)
+    if not filepath:
+        raise _ActionManGitHubError(missing_env_var=env_var_name)
+    return filepath
+
+
+def write_variables(
+    env_var_name: str,
+    variables: dict[str, dict | list | tuple | str | bool | int | float | None],
+) -> str:
+    """Format variables and write them to an environment file immediately.
+
+    All variables are formatted before anything is written to the file,
+    so that an invalid value leaves the file untouched.
+
+    Parameters
+    ----------
+    env_var_name : str
+        Name of the environment variable holding the path to the file, e.g., 'GITHUB_OUTPUT'.
+    variables : dict[str, dict | list | tuple | str | bool | int | float | None]
+        A mapping of variable names to their values.
+
+    Returns
+    -------
+    str
+        The output that was written to the file.
+
+    Raises
+    ------
+    actionman.exception.ActionManGitHubError
+        If the environment variable is not set.
+    actionman.exception.ActionManOutputVariableTypeError
+        If a value has an unsupported type.
+    actionman.exception.ActionManOutputVariableSerializationError
+        If a value could not be serialized to a JSON string.
+    """
+    filepath = get_filepath(env_var_name)
+    output = "\n".join(_format.output_variable(key=name, value=value) for name, value in variables.items())
+    if output:
+        write(filepath, f"{output}\n".encode("utf-8"))
+    return output
+
+
+def write(filepath: str, content: bytes) -> None:
+    """Write content to the end of an environment file immediately.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the environment file.
+    content : bytes
+        UTF-8 encoded content to write.
+    """
+    _write_all(_get_file_descriptor(filepath), content)
+    return
+
+
+def close(filepath: str) -> None:
+    """Close the file descriptor of an environment file, if it is open.
+
+    This must be called before the file is deleted or replaced,
+    so that subsequent writes open the new file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the environment file.
+    """
+    fd = _FILE_DESCRIPTORS.pop(filepath, None)
+    if fd is not None:
+        _os.close(fd)
+    return
+
+
+def _get_file_descriptor(filepath: str) -> int:
+    """Get an append-mode file descriptor for an environment file, opening it on first use.
+
+    With `O_APPEND`, the kernel moves to the end of the file and writes in one atomic step,
+    so each write is a single system call without any Python-level locking.
+    """
+    fd = _FILE_DESCRIPTORS.get(filepath)
+    if fd is None:
+        new_fd = _os.open(filepath, _OPEN_FLAGS, 0o666)
+        # Another thread may have opened the same file in the meantime;
+        # keep only one descriptor per file.
+        fd = _FILE_DESCRIPTORS.setdefault(filepath, new_fd)
+        if fd != new_fd:
+            _os.close(new_fd)
+    return fd
+
+
+def _write_all(fd: int, content: bytes) -> None:
+    with memoryview(content) as view:
+        written = _os.write(fd, view)
+        # Regular files are normally written in full by a single call;
+        # only retry the remainder in the rare case of a partial write.
+        while written < len(view):
+            written += _os.write(fd, view[written:])
+    return
+
+
+def _reset_after_fork() -> None:
+    # A forked child opens its own file descriptors,
+    # so that closing or replacing a file in one process does not affect the other.
+    for fd in _FILE_DESCRIPTORS.values():
+        try:
+            _os.close(fd)
+        except OSError:
+            pass
+    _FILE_DESCRIPTORS.clear()
+    return
+
+
+if hasattr(_os, "register_at_fork"):
+    _os.register_at_fork(after_in_child=_reset_after_fork)
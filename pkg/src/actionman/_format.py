@@ -1,6 +1,6 @@
-from types import NoneType as _NoneType
 import base64 as _base64
 import json as _json
+import os as _os
 
 from actionman.exception import (
     ActionManOutputVariableTypeError as _ActionManOutputVariableTypeError,
@@ -8,6 +8,14 @@ from actionman.exception import (
 )
 
 
+def _random_delimiter() -> str:
+    """Generate a random delimiter for multi-line values."""
+    return _base64.b64encode(_os.urandom(15)).decode("ascii")
+
+
+_DELIMITER = _random_delimiter()
+
+
 def output_variable(key: str, value: dict | list | tuple | str | bool | int | float | None) -> str:
     """Format a key-value pair for output.
 
@@ -36,13 +44,19 @@ def output_variable(key: str, value: dict | list | tuple | str | bool | int | fl
     """
     if isinstance(value, str):
         if "\n" in value:
-            with open("/dev/urandom", "rb") as f:
-                random_bytes = f.read(15)
-            random_delimeter = _base64.b64encode(random_bytes).decode("utf-8")
-            return f"{key}<<{random_delimeter}\n{value}\n{random_delimeter}"
-    elif isinstance(value, (dict, list, tuple, bool, int, float, _NoneType)):
+            delimiter = _DELIMITER
+            while delimiter in value:
+                delimiter = _random_delimiter()
+            return f"{key}<<{delimiter}\n{value}\n{delimiter}"
+    elif value is True:
+        value = "true"
+    elif value is False:
+        value = "false"
+    elif value is None:
+        value = "null"
+    elif isinstance(value, (dict, list, tuple, int, float)):
         try:
-            value = _json.dumps(value)
+            value = str(value) if type(value) is int else _json.dumps(value)
         except Exception as e:
             raise _ActionManOutputVariableSerializationError(
                 var_name=key,
@@ -55,3 +69,4 @@ def output_variable(key: str, value: dict | list | tuple | str | bool | int | fl
             var_value=value,
         )
     return f"{key}={value}"
+
@@ -2,20 +2,28 @@
 
 from typing import Type as _Type
 import os as _os
-from pathlib import Path as _Path
 import json as _json
+import re as _re
 
-from actionman import _format
+from actionman import _env_file
 from actionman.exception import (
-    ActionManGitHubError as _ActionManGitHubError,
     ActionManInputVariableDeserializationError as _ActionManInputVariableDeserializationError,
     ActionManInputVariableTypeError as _ActionManInputVariableTypeError,
     ActionManInputVariableTypeMismatchError as _ActionManInputVariableTypeMismatchError,
 )
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 
 _ENV_VAR_NAME = "GITHUB_ENV"
-_FILEPATH: _Path | None = _Path(_os.environ[_ENV_VAR_NAME]) if _ENV_VAR_NAME in _os.environ else None
+_SUPPORTED_TYPES = frozenset((str, bool, int, float, list, dict))
+_BOOL_LITERALS = {"true": True, "false": False}
+# orjson parses integers outside the int64/uint64 range into floats;
+# all of these have at least 19 digits, so such values are left to the standard library.
+_LONG_DIGIT_RUN = _re.compile(r"\d{19}")
 
 
 def read(
@@ -48,15 +56,21 @@ def read(
     actionman.exception.ActionManInputVariableTypeMismatchError
         If the deserialized environment variable has a type other than the specified type.
     """
-    if typ not in (str, bool, int, float, list, dict):
+    try:
+        is_supported = typ in _SUPPORTED_TYPES
+    except TypeError:  # unhashable
+        is_supported = False
+    if not is_supported:
         raise _ActionManInputVariableTypeError(var_name=name, var_type=typ)
     value = _os.environ.get(name)
     if value is None:
         return
     if typ is str:
         return value
+    if typ is bool and value in _BOOL_LITERALS:
+        return _BOOL_LITERALS[value]
     try:
-        value_deserialized = _json.loads(value)
+        value_deserialized = _json_loads(value)
     except Exception as e:
         raise _ActionManInputVariableDeserializationError(
             var_name=name,
@@ -107,9 +121,50 @@ def write(name: str, value: dict | list | tuple | str | bool | int | float | Non
     ----------
     - [GitHub Docs: Workflow Commands for GitHub Actions: Setting an environment variable](https://docs.github.com/en/actions/using-workflows/workflow-commands-for-github-actions#setting-an-environment-variable)
     """
-    if not _FILEPATH:
-        raise _ActionManGitHubError(missing_env_var=_ENV_VAR_NAME)
-    output = _format.output_variable(key=name, value=value)
-    with open(_FILEPATH, "a") as f:
-        print(output, file=f)
-    return output
+    return _env_file.write_variables(_ENV_VAR_NAME, {name: value})
+
+
+def write_many(variables: dict[str, dict | list | tuple | str | bool | int | float | None]) -> str:
+    """Set multiple persistent environment variables at once.
+
+    All variables are formatted before anything is written to the file,
+    so that an invalid value leaves the file untouched.
+
+    Parameters
+    ----------
+    variables : dict[str, dict | list | tuple | str | bool | int | float | None]
+        A mapping of environment variable names to their values.
+        Values that are not strings will be serialized and written as JSON strings.
+
+    Returns
+    -------
+    str
+        The output that was written to the file.
+        This is only useful for logging/debugging purposes.
+
+    Raises
+    ------
+    actionman.exception.ActionManGitHubError
+        If the 'GITHUB_ENV' environment variable is not set.
+    actionman.exception.ActionManOutputVariableTypeError
+        If a value has an unsupported type.
+    actionman.exception.ActionManOutputVariableSerializationError
+        If a value could not be serialized to a JSON string.
+    """
+    return _env_file.write_variables(_ENV_VAR_NAME, variables)
+
+
+def _json_loads(value: str) -> str | bool | int | float | list | dict | None:
+    """Deserialize a JSON string, using `orjson` when available.
+
+    Values that `orjson` rejects (e.g., 'NaN' and 'Infinity')
+    or would parse differently (integers outside the 64-bit range)
+    are deserialized with the standard library's `json` module instead,
+    so that the result is the same with or without `orjson`.
+    """
+    if _orjson is not None and not _LONG_DIGIT_RUN.search(value):
+        try:
+            return _orjson.loads(value)
+        except _orjson.JSONDecodeError:
+            pass
+    return _json.loads(value)
@@ -57,7 +57,8 @@ class ActionManInputVariableTypeError(ActionManInputVariableError):
 
     def __init__(self, var_name: str, var_type: _Any):
         message = (
-            f"Input variable '{var_name}' has an unsupported expected type '{var_type.__name__}'."
+            f"Input variable '{var_name}' has an unsupported expected type "
+            f"'{getattr(var_type, '__name__', var_type)}'."
         )
         super().__init__(var_name=var_name, message=message)
         return
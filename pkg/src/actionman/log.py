@@ -53,23 +53,21 @@ class Logger:
         - [GitHub Docs: Workflow Commands for GitHub Actions: Setting a debug message](https://docs.github.com/en/actions/using-workflows/workflow-commands-for-github-actions#setting-a-debug-message)
         """
         line_prefix = "::debug::"
-        len_line_prefix = len(line_prefix)
+        line_prefix_segment = _segment.Segment(line_prefix)
+        width = self.console.width - len(line_prefix)
+        options = _ConsoleOptions(
+            size=_ConsoleDimensions(width, self.console.height),
+            legacy_windows=self.console.legacy_windows,
+            min_width=width,
+            max_width=width,
+            is_terminal=True,
+            encoding=self.console.encoding,
+            max_height=self.console.size.height,
+        )
         final_lines: list[_segment.Segments] = []
         for content in contents:
-            for line in self.console.render_lines(
-                content,
-                options=_ConsoleOptions(
-                    size=_ConsoleDimensions(self.console.width - len_line_prefix, self.console.height),
-                    legacy_windows=self.console.legacy_windows,
-                    min_width=self.console.width - len_line_prefix,
-                    max_width=self.console.width - len_line_prefix,
-                    is_terminal=True,
-                    encoding=self.console.encoding,
-                    max_height=self.console.size.height,
-                ),
-                new_lines=True
-            ):
-                line.insert(0, _segment.Segment(line_prefix))
+            for line in self.console.render_lines(content, options=options, new_lines=True):
+                line.insert(0, line_prefix_segment)
                 final_lines.append(_segment.Segments(line))
         output = _Group(*final_lines, fit=False)
         if out:
@@ -127,19 +125,18 @@ class Logger:
         - [GitHub Docs: Workflow Commands for GitHub Actions: Setting a warning message](https://docs.github.com/en/actions/using-workflows/workflow-commands-for-github-actions#setting-a-warning-message)
         - [GitHub Docs: Workflow Commands for GitHub Actions: Setting an error message](https://docs.github.com/en/actions/using-workflows/workflow-commands-for-github-actions#setting-an-error-message)
         """
-        args = locals()
-        args_str = []
-        for arg_name, github_arg_name in (
-            ("title", "title"),
-            ("filename", "file"),
-            ("line_start", "line"),
-            ("line_end", "endLine"),
-            ("column_start", "col"),
-            ("column_end", "endColumn"),
-        ):
-            if args[arg_name]:
-                args_str.append(f"{github_arg_name}={args[arg_name]}")
-        args_str_full = ",".join(args_str)
+        args_str_full = ",".join(
+            f"{github_arg_name}={arg}"
+            for github_arg_name, arg in (
+                ("title", title),
+                ("file", filename),
+                ("line", line_start),
+                ("endLine", line_end),
+                ("col", column_start),
+                ("endColumn", column_end),
+            )
+            if arg
+        )
         sig_section = f" {args_str_full}" if args_str_full else ""
         output = _Text(f"::{typ}{sig_section}::", no_wrap=True)
         output.append(message)
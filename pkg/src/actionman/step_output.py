@@ -5,15 +5,10 @@ References
 - [GitHub Docs: Workflow Commands for GitHub Actions: Setting an output parameter](https://docs.github.com/en/actions/using-workflows/workflow-commands-for-github-actions#setting-an-output-parameter)
 """
 
-import os as _os
-from pathlib import Path as _Path
-
-from actionman import _format
-from actionman.exception import ActionManGitHubError as _ActionManGitHubError
+from actionman import _env_file
 
 
 _ENV_VAR_NAME = "GITHUB_OUTPUT"
-_FILEPATH: _Path | None = _Path(_os.environ[_ENV_VAR_NAME]) if _ENV_VAR_NAME in _os.environ else None
 
 
 def write(name: str, value: dict | list | tuple | str | bool | int | float | None) -> str:
@@ -45,9 +40,35 @@ def write(name: str, value: dict | list | tuple | str | bool | int | float | Non
     actionman.exception.ActionManOutputVariableSerializationError
         If the value could not be serialized to a JSON string.
     """
-    if not _FILEPATH:
-        raise _ActionManGitHubError(missing_env_var=_ENV_VAR_NAME)
-    output = _format.output_variable(key=name, value=value)
-    with open(_FILEPATH, "a") as f:
-        print(output, file=f)
-    return output
+    return _env_file.write_variables(_ENV_VAR_NAME, {name: value})
+
+
+def write_many(variables: dict[str, dict | list | tuple | str | bool | int | float | None]) -> str:
+    """Set multiple output parameters for the current step at once.
+
+    All variables are formatted before anything is written to the file,
+    so that an invalid value leaves the file untouched.
+
+    Parameters
+    ----------
+    variables : dict[str, dict | list | tuple | str | bool | int | float | None]
+        A mapping of output parameter names to their values.
+        Values that are not strings will be serialized and written as JSON strings.
+
+    Returns
+    -------
+    str
+        The output that was written to the file.
+        This is only useful for logging/debugging purposes.
+
+    Raises
+    ------
+    actionman.exception.ActionManGitHubError
+        If the 'GITHUB_OUTPUT' environment variable is not set.
+    actionman.exception.ActionManOutputVariableTypeError
+        If a value has an unsupported type.
+    actionman.exception.ActionManOutputVariableSerializationError
+        If a value could not be serialized to a JSON string.
+    """
+    return _env_file.write_variables(_ENV_VAR_NAME, variables)
+
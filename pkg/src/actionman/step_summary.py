@@ -7,17 +7,20 @@ References
 
 from __future__ import annotations as _annotations
 from typing import TYPE_CHECKING as _TYPE_CHECKING
+from contextlib import contextmanager as _contextmanager
 import os as _os
+import stat as _stat
+import tempfile as _tempfile
 from pathlib import Path as _Path
 
-from actionman.exception import ActionManGitHubError as _ActionManGitHubError
+from actionman import _env_file
 
 if _TYPE_CHECKING:
+    from typing import Iterable, Iterator
     from protocolman import Stringable
 
 
 _ENV_VAR_NAME = "GITHUB_STEP_SUMMARY"
-_FILEPATH: _Path | None = _Path(_os.environ[_ENV_VAR_NAME]) if _ENV_VAR_NAME in _os.environ else None
 
 
 def filepath() -> _Path:
@@ -28,9 +31,7 @@ def filepath() -> _Path:
     actionman.exception.ActionManGitHubError
         If the 'GITHUB_STEP_SUMMARY' environment variable is not set.
     """
-    if not _FILEPATH:
-        raise _ActionManGitHubError(missing_env_var=_ENV_VAR_NAME)
-    return _FILEPATH
+    return _Path(_env_file.get_filepath(_ENV_VAR_NAME))
 
 
 def read() -> str | None:
@@ -41,9 +42,12 @@ def read() -> str | None:
     actionman.exception.ActionManGitHubError
         If the 'GITHUB_STEP_SUMMARY' environment variable is not set.
     """
-    if not _FILEPATH:
-        raise _ActionManGitHubError(missing_env_var=_ENV_VAR_NAME)
-    return _FILEPATH.read_text() if _FILEPATH.is_file() else None
+    path = _env_file.get_filepath(_ENV_VAR_NAME)
+    try:
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8")
+    except FileNotFoundError:
+        return None
 
 
 def append(content: Stringable) -> None:
@@ -54,25 +58,75 @@ def append(content: Stringable) -> None:
     actionman.exception.ActionManGitHubError
         If the 'GITHUB_STEP_SUMMARY' environment variable is not set.
     """
-    if not _FILEPATH:
-        raise _ActionManGitHubError(missing_env_var=_ENV_VAR_NAME)
-    with open(_FILEPATH, "a") as f:
-        print(content, file=f)
+    _env_file.write(_env_file.get_filepath(_ENV_VAR_NAME), f"{content}\n".encode("utf-8"))
     return
 
 
+def append_many(contents: Iterable[Stringable]) -> None:
+    """Append each of the given contents to the step summary file, in order.
+
+    This is equivalent to calling `append` for each content,
+    but encodes all contents at once.
+
+    Raises
+    ------
+    actionman.exception.ActionManGitHubError
+        If the 'GITHUB_STEP_SUMMARY' environment variable is not set.
+    """
+    _env_file.write(_env_file.get_filepath(_ENV_VAR_NAME), "".join(f"{content}\n" for content in contents).encode("utf-8"))
+    return
+
+
+@_contextmanager
+def batch() -> Iterator[list[Stringable]]:
+    """Collect step summary contents and append them to the file all at once.
+
+    This yields a list, to which contents can be added within the context.
+    When the context exits (also due to an exception),
+    all collected contents are appended in order, as with `append_many`.
+
+    Raises
+    ------
+    actionman.exception.ActionManGitHubError
+        If the 'GITHUB_STEP_SUMMARY' environment variable is not set.
+    """
+    _env_file.get_filepath(_ENV_VAR_NAME)
+    contents: list[Stringable] = []
+    try:
+        yield contents
+    finally:
+        append_many(contents)
+
+
 def write(content: Stringable) -> None:
     """Overwrite the step summary file with the given content.
 
+    The content is first written to a uniquely named temporary file next to the step summary file,
+    which then atomically replaces it, so that the file is never left partially written.
+
     Raises
     ------
     actionman.exception.ActionManGitHubError
         If the 'GITHUB_STEP_SUMMARY' environment variable is not set.
     """
-    if not _FILEPATH:
-        raise _ActionManGitHubError(missing_env_var=_ENV_VAR_NAME)
-    with open(_FILEPATH, "w") as f:
-        print(content, file=f)
+    path = _env_file.get_filepath(_ENV_VAR_NAME)
+    payload = f"{content}\n".encode("utf-8")
+    fd, temp_path = _tempfile.mkstemp(dir=_os.path.dirname(path), prefix=f"{_os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with open(fd, "wb") as f:
+            if hasattr(_os, "fchmod"):
+                # mkstemp creates the file readable only by the owner;
+                # keep the permissions of the existing file instead,
+                # or use those `open` would give a new file.
+                _os.fchmod(f.fileno(), _file_mode(path))
+            f.write(payload)
+        # Nothing is pending on the descriptor, so closing it first loses no content
+        # even if the replacement fails.
+        _env_file.close(path)
+        _os.replace(temp_path, path)
+    except BaseException:
+        _os.unlink(temp_path)
+        raise
     return
 
 
@@ -84,7 +138,16 @@ def remove() -> None:
     actionman.exception.ActionManGitHubError
         If the 'GITHUB_STEP_SUMMARY' environment variable is not set.
     """
-    if not _FILEPATH:
-        raise _ActionManGitHubError(missing_env_var=_ENV_VAR_NAME)
-    _FILEPATH.unlink()
+    path = _env_file.get_filepath(_ENV_VAR_NAME)
+    _env_file.close(path)
+    _os.unlink(path)
     return
+
+
+def _file_mode(path: str) -> int:
+    try:
+        return _stat.S_IMODE(_os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = _os.umask(0)
+        _os.umask(umask)
+        return 0o666 & ~umask